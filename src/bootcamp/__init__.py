@@ -2,6 +2,26 @@
 Modern Python Data Science Bootcamp
 
 A comprehensive, self-paced bootcamp delivered as interactive Marimo notebooks.
+
+The heavy notebook libraries are available as lazily imported facades
+(``from bootcamp import mo, pl, duckdb, sklearn, pa, pydantic``); each is only
+imported on first use. See ``bootcamp.lazy``.
 """
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    from bootcamp.lazy import LAZY_MODULES, lazy_import
+
+    if name in LAZY_MODULES:
+        module = lazy_import(LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    from bootcamp.lazy import LAZY_MODULES
+
+    return sorted([*globals(), *LAZY_MODULES])
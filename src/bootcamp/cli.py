@@ -0,0 +1,423 @@
+"""Command-line entry point for bootcamp maintenance tasks.
+
+``bootcamp check`` fans the CI quality checks (ruff lint, ruff format, ty, and
+notebook/test execution) out concurrently per file and merges the results into
+one report. Results are cached per file content hash in ``.bootcamp_cache/`` so
+unchanged files are not re-checked.
+
+``bootcamp prewarm`` pre-compiles bytecode for a kernel image, and
+``bootcamp importtime`` reports each notebook's import cost (see bootcamp.startup).
+
+Example:
+    uv run bootcamp check                       # every notebook, src/ and tests/ file
+    uv run bootcamp check notebooks/module_02_local_data_stack
+    uv run bootcamp check --jobs 4 --json report.json
+    uv run bootcamp check --skip execute       # leave notebook execution to notebooks.yml
+    uv run bootcamp importtime notebooks/module_00_environment
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+DEFAULT_ROOTS = (Path("notebooks"), Path("src"), Path("tests"))
+CACHE_DIR = Path(".bootcamp_cache")
+
+# Files whose contents affect every check result (tool versions and configuration)
+CONFIG_FILES = (Path("pyproject.toml"), Path("uv.lock"))
+
+
+class Check(NamedTuple):
+    """A quality check run against a single file.
+
+    Attributes:
+        name: Short name used in the report (e.g., 'lint')
+        command: Command to run; the file path is appended as the last argument
+    """
+
+    name: str
+    command: tuple[str, ...]
+
+
+LINT = Check("lint", ("ruff", "check", "--no-cache"))
+FORMAT = Check("format", ("ruff", "format", "--check", "--no-cache"))
+TYPECHECK = Check("typecheck", ("ty", "check"))
+EXECUTE = Check("execute", ("marimo", "export", "html", "-o", os.devnull))
+PYTEST = Check("pytest", (sys.executable, "-m", "pytest", "-q", "--no-header"))
+ALL_CHECKS = (LINT, FORMAT, TYPECHECK, EXECUTE, PYTEST)
+
+
+class CheckResult(NamedTuple):
+    """Outcome of running one check on one file.
+
+    Attributes:
+        check: Name of the check that ran
+        path: File that was checked
+        returncode: Exit code of the check (0 = success)
+        output: Combined stdout and stderr
+        duration: Execution time in seconds (0.0 when served from cache)
+        cached: True if the result was reused from a previous run
+    """
+
+    check: str
+    path: str
+    returncode: int
+    output: str
+    duration: float
+    cached: bool
+
+
+def has_tag(path: Path, tag: str) -> bool:
+    """Check if a notebook declares a tag in its docstring ``Tags:`` line.
+
+    Args:
+        path: Path to notebook file
+        tag: Tag to search for (e.g., 'requires-databricks')
+
+    Returns:
+        True if the tag is listed in the first 20 lines of the file.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = "".join(f.readline() for _ in range(20))
+    except OSError:
+        return False
+
+    match = re.search(r"Tags:\s*(.+)", content, re.IGNORECASE)
+    return bool(match) and tag in [t.strip() for t in match.group(1).split(",")]
+
+
+def checks_for(path: Path) -> list[Check]:
+    """Select the checks that apply to a file.
+
+    Every file is linted and format-checked. Files are also type-checked,
+    except notebooks tagged ``requires-databricks``, whose imports are not
+    installed. Other notebooks are executed, and files under ``tests/`` are run
+    with pytest. ``tests/test_notebooks.py`` is skipped for execution because
+    per-notebook execution replaces it.
+
+    Args:
+        path: File to check, absolute or relative to the repository root
+
+    Returns:
+        List of checks to run on the file.
+    """
+    path = repo_relative(path)
+    checks = [LINT, FORMAT]
+    if path.parts[0] == "notebooks" and has_tag(path, "requires-databricks"):
+        return checks
+    checks.append(TYPECHECK)
+    if path.parts[0] == "notebooks":
+        checks.append(EXECUTE)
+    elif path.parts[0] == "tests" and path.name.startswith("test_"):
+        if path.name != "test_notebooks.py":
+            checks.append(PYTEST)
+    return checks
+
+
+def repo_relative(path: Path) -> Path:
+    """Express a path relative to the repository root (the working directory).
+
+    Args:
+        path: Absolute or relative path
+
+    Returns:
+        The path relative to the repository root, or unchanged if it lies outside it.
+    """
+    if not path.is_absolute():
+        return path
+    try:
+        return path.resolve().relative_to(Path.cwd().resolve())
+    except ValueError:
+        return path
+
+
+def discover_files(paths: Sequence[Path]) -> list[Path]:
+    """Expand files and directories into a sorted list of Python files.
+
+    Args:
+        paths: Files or directories to check
+
+    Returns:
+        Sorted, de-duplicated list of ``.py`` files, excluding ``__init__.py``
+        under notebooks/.
+    """
+    files = set()
+    for path in map(repo_relative, paths):
+        if path.is_dir():
+            files.update(path.rglob("*.py"))
+        elif path.suffix == ".py" and path.exists():
+            files.add(path)
+    return sorted(f for f in files if not (f.parts[0] == "notebooks" and f.name == "__init__.py"))
+
+
+def _digest(*chunks: bytes) -> str:
+    hasher = hashlib.sha256()
+    for chunk in chunks:
+        hasher.update(hashlib.sha256(chunk).digest())
+    return hasher.hexdigest()
+
+
+def _read_all(paths: Sequence[Path]) -> list[bytes]:
+    return [p.read_bytes() for p in paths if p.is_file()]
+
+
+class ResultCache:
+    """On-disk cache of check results keyed by file content hash.
+
+    A cache key combines the checked file's contents, the check command and
+    the repository configuration (``pyproject.toml`` and ``uv.lock``). Every
+    check except lint and format also depends on every file under ``src/``,
+    since notebooks and tests import the bootcamp package.
+
+    Args:
+        directory: Cache directory (default: .bootcamp_cache/)
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR) -> None:
+        self.file = directory / "checks.json"
+        self.entries: dict[str, dict] = {}
+        if self.file.exists():
+            try:
+                self.entries = json.loads(self.file.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                self.entries = {}
+        self._config = _digest(*_read_all(CONFIG_FILES))
+        self._src = _digest(*_read_all(sorted(Path("src").rglob("*.py"))))
+
+    def key(self, check: Check, path: Path) -> str:
+        """Compute the cache key for a check on a file."""
+        context = "" if check in (LINT, FORMAT) else self._src
+        return _digest(
+            path.read_bytes(),
+            " ".join(check.command).encode(),
+            self._config.encode(),
+            context.encode(),
+        )
+
+    def get(self, check: Check, path: Path) -> CheckResult | None:
+        """Return a cached result if the file and its context are unchanged."""
+        entry = self.entries.get(f"{check.name}:{path.as_posix()}")
+        if entry is None or entry["key"] != self.key(check, path):
+            return None
+        return CheckResult(
+            check.name, path.as_posix(), entry["returncode"], entry["output"], 0.0, True
+        )
+
+    def put(self, check: Check, path: Path, result: CheckResult) -> None:
+        """Store a fresh result."""
+        self.entries[f"{check.name}:{path.as_posix()}"] = {
+            "key": self.key(check, path),
+            "returncode": result.returncode,
+            "output": result.output,
+        }
+
+    def save(self) -> None:
+        """Write the cache to disk."""
+        self.file.parent.mkdir(parents=True, exist_ok=True)
+        self.file.write_text(json.dumps(self.entries, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def run_check(check: Check, path: Path, timeout_seconds: int = 600) -> CheckResult:
+    """Run a single check on a single file.
+
+    Args:
+        check: Check to run
+        path: File to check
+        timeout_seconds: Maximum execution time in seconds (default: 600 = 10 minutes)
+
+    Returns:
+        CheckResult with the exit code and combined output. A missing tool is
+        reported as exit code 127, a timeout as exit code -1.
+    """
+    start_time = time.time()
+    try:
+        result = subprocess.run(
+            [*check.command, str(path)],
+            capture_output=True,
+            text=True,
+            timeout=timeout_seconds,
+            check=False,
+        )
+        returncode, output = result.returncode, result.stdout + result.stderr
+    except FileNotFoundError:
+        returncode, output = 127, f"Command not found: {check.command[0]}"
+    except subprocess.TimeoutExpired:
+        returncode, output = -1, f"Check exceeded {timeout_seconds}s timeout"
+
+    return CheckResult(
+        check.name, path.as_posix(), returncode, output, time.time() - start_time, False
+    )
+
+
+def run_checks(
+    files: Sequence[Path],
+    jobs: int | None = None,
+    cache: ResultCache | None = None,
+    skip: Sequence[str] = (),
+) -> list[CheckResult]:
+    """Run every applicable check on every file concurrently.
+
+    Args:
+        files: Files to check
+        jobs: Maximum number of concurrent checks (default: CPU count)
+        cache: Result cache to consult and update. If None, nothing is cached.
+        skip: Names of checks not to run (e.g., ['execute'])
+
+    Returns:
+        Results sorted by path then check name.
+    """
+    results: list[CheckResult] = []
+    pending: list[tuple[Check, Path]] = []
+    for path in files:
+        for check in checks_for(path):
+            if check.name in skip:
+                continue
+            cached = cache.get(check, path) if cache else None
+            if cached is not None:
+                results.append(cached)
+            else:
+                pending.append((check, path))
+
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        futures = [(check, path, pool.submit(run_check, check, path)) for check, path in pending]
+        for check, path, future in futures:
+            result = future.result()
+            results.append(result)
+            # Timeouts and missing tools say nothing about the file, so don't cache them
+            if cache and result.returncode not in (-1, 127):
+                cache.put(check, path, result)
+
+    return sorted(results, key=lambda r: (r.path, r.check))
+
+
+def format_report(results: Sequence[CheckResult]) -> str:
+    """Render check results as a single human-readable report.
+
+    Args:
+        results: Results from run_checks
+
+    Returns:
+        Report listing the output of every failed check followed by a summary line.
+    """
+    lines = []
+    failures = [r for r in results if r.returncode != 0]
+    for r in failures:
+        lines.append(f"FAILED {r.check} {r.path} (exit {r.returncode})")
+        lines.extend(f"    {line}" for line in r.output.strip().splitlines())
+        lines.append("")
+
+    cached = sum(r.cached for r in results)
+    files = len({r.path for r in results})
+    lines.append(
+        f"{len(results) - len(failures)} passed, {len(failures)} failed "
+        f"({len(results)} checks on {files} files, {cached} from cache)"
+    )
+    return "\n".join(lines)
+
+
+def _check_command(args: argparse.Namespace) -> int:
+    files = discover_files(args.paths or DEFAULT_ROOTS)
+    cache = None if args.no_cache else ResultCache()
+
+    results = run_checks(files, jobs=args.jobs, cache=cache, skip=args.skip)
+    if cache:
+        cache.save()
+
+    print(format_report(results))
+    if args.json:
+        args.json.write_text(json.dumps([r._asdict() for r in results], indent=2), encoding="utf-8")
+    return 1 if any(r.returncode != 0 for r in results) else 0
+
+
+def _prewarm_command(args: argparse.Namespace) -> int:
+    from bootcamp.startup import HEAVY_MODULES, compile_bytecode
+
+    start_time = time.time()
+    ok = compile_bytecode(args.paths or DEFAULT_ROOTS, modules=HEAVY_MODULES)
+    print(f"Compiled bytecode for {', '.join(HEAVY_MODULES)} in {time.time() - start_time:.1f}s")
+    return 0 if ok else 1
+
+
+def _importtime_command(args: argparse.Namespace) -> int:
+    from bootcamp.startup import format_import_report, notebook_import_report
+
+    # Measured one at a time: concurrent interpreters compete for CPU and disk
+    notebooks = discover_files(args.paths or [Path("notebooks")])
+    reports = [notebook_import_report(notebook, repeats=args.repeats) for notebook in notebooks]
+    print(format_import_report(reports, top=args.top))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``bootcamp`` argument parser."""
+    parser = argparse.ArgumentParser(prog="bootcamp", description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser(
+        "check", help="Run lint, format, type and execution checks per file, in parallel"
+    )
+    check.add_argument(
+        "paths", nargs="*", type=Path, help="Files or directories (default: notebooks src tests)"
+    )
+    check.add_argument("-j", "--jobs", type=int, help="Concurrent checks (default: CPU count)")
+    check.add_argument("--no-cache", action="store_true", help="Ignore and don't update the cache")
+    check.add_argument("--json", type=Path, help="Also write the merged report as JSON")
+    check.add_argument(
+        "--skip",
+        action="append",
+        default=[],
+        choices=[c.name for c in ALL_CHECKS],
+        help="Check to leave out; repeatable (e.g., --skip execute)",
+    )
+    check.set_defaults(handler=_check_command)
+
+    prewarm = commands.add_parser(
+        "prewarm", help="Pre-compile bytecode for notebooks and the heavy notebook libraries"
+    )
+    prewarm.add_argument(
+        "paths", nargs="*", type=Path, help="Files or directories (default: notebooks src tests)"
+    )
+    prewarm.set_defaults(handler=_prewarm_command)
+
+    importtime = commands.add_parser(
+        "importtime", help="Report each notebook's import time, eager versus lazy facades"
+    )
+    importtime.add_argument(
+        "paths", nargs="*", type=Path, help="Notebooks or directories (default: notebooks)"
+    )
+    importtime.add_argument(
+        "--top", type=int, default=5, help="Slowest modules listed per notebook"
+    )
+    importtime.add_argument(
+        "--repeats", type=int, default=5, help="Measured runs per variant after a warm-up"
+    )
+    importtime.set_defaults(handler=_importtime_command)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``bootcamp`` command line.
+
+    Args:
+        argv: Arguments to parse (default: sys.argv[1:])
+
+    Returns:
+        Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Lazily imported facades for the bootcamp's heavy libraries.
+
+Importing marimo, polars, duckdb, scikit-learn, pandera and pydantic takes
+several seconds. The facades returned here are real module objects whose code
+only runs on first attribute access, so a notebook cell that binds them pays
+almost nothing until the library is actually used.
+
+Example:
+    from bootcamp import pl, duckdb   # no import cost yet
+    df = pl.DataFrame({"a": [1, 2]})  # polars is imported here
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+# Facade name exposed on the bootcamp package -> module it stands in for
+LAZY_MODULES = {
+    "mo": "marimo",
+    "pl": "polars",
+    "duckdb": "duckdb",
+    "sklearn": "sklearn",
+    "pa": "pandera",
+    "pydantic": "pydantic",
+}
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Return a module that is executed on first attribute access.
+
+    If the module has already been imported, the loaded module is returned
+    unchanged.
+
+    Args:
+        name: Absolute module name (e.g., 'polars')
+
+    Returns:
+        The module, registered in ``sys.modules`` so later ``import`` statements
+        share it.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,310 @@
+"""Notebook startup tooling: bytecode pre-warming and import-time reports.
+
+Supports the NFR-01 notebook load budget (<5 seconds):
+
+* ``compile_bytecode`` snapshots ``.pyc`` files for the notebooks, the bootcamp
+  package and the heavy libraries, so a fresh kernel image never compiles.
+* ``notebook_import_report`` measures a notebook's imports with
+  ``python -X importtime`` and compares them against the same notebook bound
+  through the lazy facades from ``bootcamp.lazy``, touching every module
+  attribute the notebook uses.
+"""
+
+import ast
+import compileall
+import functools
+import importlib.util
+import re
+import statistics
+import subprocess
+import sys
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import NamedTuple
+
+from bootcamp.lazy import LAZY_MODULES
+
+HEAVY_MODULES = tuple(LAZY_MODULES.values())
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportTime(NamedTuple):
+    """One line of ``python -X importtime`` output.
+
+    Attributes:
+        module: Imported module name
+        self_us: Time spent importing the module itself, in microseconds
+        cumulative_us: Time including the module's own imports, in microseconds
+        depth: Nesting level (0 = imported directly by the measured code)
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+class ImportMeasurement(NamedTuple):
+    """Imports triggered by a piece of code and how long the code took.
+
+    Attributes:
+        imports: Top-level (depth 0) imports, excluding interpreter startup modules
+        elapsed_ms: Wall time to run the code, excluding interpreter startup
+    """
+
+    imports: list[ImportTime]
+    elapsed_ms: float
+
+
+class NotebookImportReport(NamedTuple):
+    """Import cost of a notebook, eager versus lazy.
+
+    Attributes:
+        notebook: Path to the notebook
+        imports: Top-level modules imported by the notebook, slowest first
+        eager_samples: Wall times (ms) of each run of the notebook's imports as written
+        lazy_samples: Wall times (ms) of each run binding the notebook's ``import``
+            statements as lazy facades and then accessing every module attribute
+            the notebook uses. ``from ... import`` statements bind objects, so
+            they stay eager.
+    """
+
+    notebook: Path
+    imports: list[ImportTime]
+    eager_samples: list[float]
+    lazy_samples: list[float]
+
+    @property
+    def eager_ms(self) -> float:
+        """Median eager wall time in milliseconds."""
+        return statistics.median(self.eager_samples)
+
+    @property
+    def lazy_ms(self) -> float:
+        """Median lazy wall time in milliseconds."""
+        return statistics.median(self.lazy_samples)
+
+
+def compile_bytecode(paths: Iterable[Path] = (), modules: Iterable[str] = HEAVY_MODULES) -> bool:
+    """Pre-compile bytecode for source trees and installed libraries.
+
+    Args:
+        paths: Extra files or directories to compile (e.g., notebooks/)
+        modules: Installed packages whose source directories should be compiled.
+            Packages that are not installed are skipped.
+
+    Returns:
+        True if every file compiled successfully.
+    """
+    targets = [Path(p) for p in paths]
+    for name in modules:
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.origin:
+            origin = Path(spec.origin)
+            targets.append(origin.parent if origin.name == "__init__.py" else origin)
+
+    ok = True
+    for target in targets:
+        if target.is_dir():
+            ok &= bool(compileall.compile_dir(target, quiet=1, workers=0))
+        elif target.is_file():
+            ok &= bool(compileall.compile_file(target, quiet=1))
+    return ok
+
+
+def parse_importtime(stderr: str) -> list[ImportTime]:
+    """Parse ``python -X importtime`` output.
+
+    Args:
+        stderr: Standard error captured from an interpreter run with ``-X importtime``
+
+    Returns:
+        Every import recorded, in the order Python reported them.
+    """
+    times = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            times.append(
+                ImportTime(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+            )
+    return times
+
+
+def measure_imports(code: str, timeout_seconds: int = 120) -> ImportMeasurement:
+    """Run code in a fresh interpreter, recording what it imports and its wall time.
+
+    Args:
+        code: Python source to execute
+        timeout_seconds: Maximum execution time in seconds (default: 120)
+
+    Returns:
+        ImportMeasurement with the code's top-level imports and elapsed time.
+    """
+    timed = (
+        "import time as _bootcamp_time\n"
+        "_bootcamp_start = _bootcamp_time.perf_counter()\n"
+        f"{code}\n"
+        "print((_bootcamp_time.perf_counter() - _bootcamp_start) * 1000)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", timed],
+        capture_output=True,
+        text=True,
+        timeout=timeout_seconds,
+        check=False,
+    )
+    baseline = _interpreter_baseline()
+    output = result.stdout.strip().splitlines()
+    return ImportMeasurement(
+        imports=[
+            t for t in parse_importtime(result.stderr) if t.depth == 0 and t.module not in baseline
+        ],
+        elapsed_ms=float(output[-1]) if output else float("nan"),
+    )
+
+
+def notebook_imports(notebook_path: Path) -> list[str]:
+    """Collect the absolute import statements of a notebook.
+
+    Marimo notebooks import inside cell functions, so the whole module is
+    searched rather than just its top level.
+
+    Args:
+        notebook_path: Path to the notebook
+
+    Returns:
+        Import statements as source lines, de-duplicated in first-seen order.
+    """
+    tree = ast.parse(notebook_path.read_text(encoding="utf-8"))
+    statements = [
+        ast.unparse(node)
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Import) or (isinstance(node, ast.ImportFrom) and node.level == 0)
+    ]
+    return list(dict.fromkeys(statements))
+
+
+def notebook_import_report(notebook_path: Path, repeats: int = 5) -> NotebookImportReport:
+    """Measure a notebook's import cost, eager and through lazy facades.
+
+    One discarded warm-up run of each variant fills the page cache and
+    bytecode caches first. Each variant then runs ``repeats`` times in
+    alternating order (eager first, then lazy first, ...) so neither variant
+    consistently benefits from running second.
+
+    The lazy run binds each ``import`` statement with ``lazy_import`` and then
+    accesses every ``module.attribute`` the notebook uses, so a library the
+    notebook needs straight away (e.g., ``marimo.App``) is charged in full.
+    Each statement is guarded so a missing optional library (e.g., databricks)
+    does not abort the measurement.
+
+    Args:
+        notebook_path: Path to the notebook
+        repeats: Measured runs per variant after the warm-up (default: 5)
+
+    Returns:
+        NotebookImportReport with per-module timings and every eager/lazy sample.
+    """
+    eager_code = "\n".join(_guarded(s) for s in notebook_imports(notebook_path))
+    lazy_code = _lazy_equivalent(notebook_path)
+
+    measure_imports(eager_code)
+    measure_imports(lazy_code)
+
+    eager: list[ImportMeasurement] = []
+    lazy: list[ImportMeasurement] = []
+    for i in range(repeats):
+        runs = [(eager_code, eager), (lazy_code, lazy)]
+        for code, samples in runs if i % 2 == 0 else reversed(runs):
+            samples.append(measure_imports(code))
+
+    # Per-module breakdown from the eager run closest to the median
+    median = statistics.median(m.elapsed_ms for m in eager)
+    typical = min(eager, key=lambda m: abs(m.elapsed_ms - median))
+    return NotebookImportReport(
+        notebook=notebook_path,
+        imports=sorted(typical.imports, key=lambda t: t.cumulative_us, reverse=True),
+        eager_samples=[m.elapsed_ms for m in eager],
+        lazy_samples=[m.elapsed_ms for m in lazy],
+    )
+
+
+def format_import_report(reports: Sequence[NotebookImportReport], top: int = 5) -> str:
+    """Render import reports as a plain-text table.
+
+    Args:
+        reports: Reports from notebook_import_report
+        top: Number of slowest modules to list per notebook (default: 5)
+
+    Returns:
+        One block per notebook with median eager/lazy times, their min-max
+        spread, and the notebook's slowest imports. A difference smaller than
+        the spread is reported as within noise rather than as a saving.
+    """
+    lines = []
+    for report in reports:
+        saved = report.eager_ms - report.lazy_ms
+        noise = max(_spread(report.eager_samples), _spread(report.lazy_samples))
+        verdict = f"saves {saved:.1f} ms" if abs(saved) > noise else "within noise"
+        lines.append(
+            f"{report.notebook} (median of {len(report.eager_samples)}): "
+            f"eager {report.eager_ms:.1f} ms ({_range(report.eager_samples)}), "
+            f"lazy incl. used attributes {report.lazy_ms:.1f} ms "
+            f"({_range(report.lazy_samples)}), {verdict}"
+        )
+        for t in report.imports[:top]:
+            lines.append(f"    {t.cumulative_us / 1000:8.1f} ms  {t.module}")
+    return "\n".join(lines)
+
+
+def _spread(samples: Sequence[float]) -> float:
+    return max(samples) - min(samples)
+
+
+def _range(samples: Sequence[float]) -> str:
+    return f"{min(samples):.1f}-{max(samples):.1f}"
+
+
+def _guarded(statement: str) -> str:
+    return f"try:\n    {statement}\nexcept Exception:\n    pass"
+
+
+def _lazy_equivalent(notebook_path: Path) -> str:
+    """Rewrite a notebook's imports as lazy bindings plus the attribute accesses it makes."""
+    tree = ast.parse(notebook_path.read_text(encoding="utf-8"))
+    bindings: dict[str, str] = {}
+    statements = ["from bootcamp.lazy import lazy_import"]
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                name = alias.asname or alias.name.split(".")[0]
+                module = alias.name if alias.asname else name
+                bindings.setdefault(name, module)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            statements.append(ast.unparse(node))
+
+    statements += [f"{name} = lazy_import({module!r})" for name, module in bindings.items()]
+    attributes = {
+        f"{node.value.id}.{node.attr}"
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id in bindings
+    }
+    statements += sorted(attributes)
+    return "\n".join(_guarded(s) for s in dict.fromkeys(statements))
+
+
+@functools.cache
+def _interpreter_baseline() -> frozenset[str]:
+    """Modules every interpreter imports before running any code."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return frozenset(t.module for t in parse_importtime(result.stderr))
@@ -0,0 +1,358 @@
+"""Learner progress events with a batched, append-only Parquet log.
+
+Notebooks record open, complete and exercise-attempt events into an in-memory
+buffer. The buffer is flushed in batches to Parquet files partitioned by day
+(``<root>/events/date=YYYY-MM-DD/*.parquet``), so many learners produce a few
+large writes rather than one small write per event. ``compact`` merges the small
+files in a partition, and ``refresh_rollups`` precomputes the tables behind the
+cohort dashboards (PRD success metrics: completion rate, time to completion).
+
+The log can be queried from DuckDB as well:
+    SELECT * FROM read_parquet('<root>/events/*/*.parquet', hive_partitioning = true)
+
+Example:
+    with EventLog("data/telemetry") as log:
+        log.record(LearnerEvent("learner-1", "00_01", EventType.OPEN, cohort="2026-fall"))
+    completion = EventLog("data/telemetry").rollup("notebook_completion")
+"""
+
+import os
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, date, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Self
+
+import polars as pl
+
+
+class EventType(StrEnum):
+    """Kinds of learner events."""
+
+    OPEN = "open"
+    COMPLETE = "complete"
+    EXERCISE_ATTEMPT = "exercise_attempt"
+
+
+@dataclass
+class LearnerEvent:
+    """A single learner interaction with a notebook.
+
+    Attributes:
+        learner_id: Stable, pseudonymous learner identifier
+        notebook: Notebook identifier as ``<module>_<sequence>`` (e.g., '02_03')
+        event_type: What happened
+        cohort: Cohort the learner belongs to, if any
+        exercise: Exercise identifier for exercise attempts
+        success: Whether an exercise attempt passed
+        timestamp: UTC time of the event
+    """
+
+    learner_id: str
+    notebook: str
+    event_type: EventType
+    cohort: str | None = None
+    exercise: str | None = None
+    success: bool | None = None
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+_EVENT_SCHEMA = {
+    "learner_id": pl.String,
+    "notebook": pl.String,
+    "event_type": pl.String,
+    "cohort": pl.String,
+    "exercise": pl.String,
+    "success": pl.Boolean,
+    "timestamp": pl.Datetime("us", "UTC"),
+}
+
+
+class EventLog:
+    """Buffered, append-only event log stored as day-partitioned Parquet.
+
+    ``record`` is thread-safe. The buffer is flushed when it holds
+    ``batch_size`` events, when ``flush_interval_seconds`` have passed since the
+    last flush (checked on each ``record``), and on ``close``. Use the log as a
+    context manager so buffered events are never lost.
+
+    Args:
+        root: Directory holding ``events/`` and ``rollups/``
+        batch_size: Events buffered before a flush (default: 500)
+        flush_interval_seconds: Maximum age of buffered events before the next
+            ``record`` triggers a flush (default: 30.0)
+    """
+
+    def __init__(
+        self, root: str | Path, batch_size: int = 500, flush_interval_seconds: float = 30.0
+    ) -> None:
+        self.root = Path(root)
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self._buffer: list[LearnerEvent] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    @property
+    def events_dir(self) -> Path:
+        """Directory holding the partitioned event files."""
+        return self.root / "events"
+
+    @property
+    def rollups_dir(self) -> Path:
+        """Directory holding precomputed rollup tables."""
+        return self.root / "rollups"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def record(self, event: LearnerEvent) -> None:
+        """Buffer an event, flushing if the batch is full or stale.
+
+        Args:
+            event: Event to record
+        """
+        with self._lock:
+            self._buffer.append(event)
+            due = (
+                len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> list[Path]:
+        """Write all buffered events, one Parquet file per day partition.
+
+        Each file is written under a temporary name and renamed into place, so
+        ``scan`` and ``compact`` never read a partial file. If a write fails, the
+        events not yet written are put back at the front of the buffer and the
+        error is re-raised.
+
+        Returns:
+            Paths of the files written (empty if the buffer was empty).
+        """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+            self._last_flush = time.monotonic()
+        if not events:
+            return []
+
+        df = pl.DataFrame([asdict(e) for e in events], schema=_EVENT_SCHEMA).with_row_index(
+            "_event"
+        )
+        written = []
+        flushed: set[int] = set()
+        try:
+            for (day,), partition in df.group_by(pl.col("timestamp").dt.date()):
+                target = self._partition_dir(day) / f"part-{uuid.uuid4().hex}.parquet"
+                staging = target.with_suffix(".tmp")
+                target.parent.mkdir(parents=True, exist_ok=True)
+                partition.drop("_event").write_parquet(staging)
+                staging.rename(target)
+                written.append(target)
+                flushed.update(partition["_event"].to_list())
+        except Exception:
+            with self._lock:
+                self._buffer[:0] = [e for i, e in enumerate(events) if i not in flushed]
+            raise
+        return written
+
+    def close(self) -> None:
+        """Flush any buffered events."""
+        self.flush()
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazily read every flushed event.
+
+        Returns:
+            LazyFrame over all events, including the ``date`` partition column.
+            Empty (with the event schema) if nothing has been flushed yet.
+        """
+        if not any(self.events_dir.glob("date=*/*.parquet")):
+            return pl.LazyFrame(schema={**_EVENT_SCHEMA, "date": pl.Date})
+        return pl.scan_parquet(
+            self.events_dir / "date=*" / "*.parquet",
+            hive_partitioning=True,
+            hive_schema={"date": pl.Date},
+        )
+
+    def compact(self, min_files: int = 2, small_file_bytes: int = 8 * 1024 * 1024) -> int:
+        """Merge small files within each day partition into a single file.
+
+        Only files smaller than ``small_file_bytes`` are merged, so files that
+        were already compacted are not rewritten on every run. The merged file
+        is written under a temporary name and renamed into place before the
+        originals are removed, so readers never see a partial file. A reader
+        that lists the partition between the rename and the removal may briefly
+        see events twice.
+
+        Compaction is safe to run from several processes at once. Each
+        partition is claimed with an exclusive ``.compact.lock`` file, and
+        partitions locked by another compactor are skipped. A lock older than
+        ``LOCK_TIMEOUT_SECONDS`` is treated as left behind by a crashed
+        compactor and is broken.
+
+        Args:
+            min_files: Only compact partitions with at least this many small files (default: 2)
+            small_file_bytes: Files at least this large are left alone (default: 8 MiB)
+
+        Returns:
+            Number of files removed.
+        """
+        removed = 0
+        for partition in sorted(self.events_dir.glob("date=*")):
+            lock = partition / ".compact.lock"
+            if not _acquire_lock(lock):
+                continue
+            try:
+                files = sorted(
+                    f for f in partition.glob("*.parquet") if f.stat().st_size < small_file_bytes
+                )
+                if len(files) < min_files:
+                    continue
+
+                merged = pl.read_parquet(files, hive_partitioning=False).sort("timestamp")
+                name = f"compacted-{uuid.uuid4().hex}"
+                staging = partition / f"{name}.tmp"
+                merged.write_parquet(staging)
+                staging.rename(partition / f"{name}.parquet")
+                for f in files:
+                    f.unlink()
+                removed += len(files)
+            finally:
+                lock.unlink(missing_ok=True)
+        return removed
+
+    def refresh_rollups(self) -> dict[str, Path]:
+        """Recompute every rollup table and write it to ``rollups/``.
+
+        Returns:
+            Mapping of rollup name to the Parquet file written.
+        """
+        events = self.scan()
+        self.rollups_dir.mkdir(parents=True, exist_ok=True)
+        written = {}
+        for name, build in ROLLUPS.items():
+            target = self.rollups_dir / f"{name}.parquet"
+            staging = target.with_suffix(".tmp")
+            build(events).collect().write_parquet(staging)
+            staging.replace(target)
+            written[name] = target
+        return written
+
+    def rollup(self, name: str) -> pl.DataFrame:
+        """Read a precomputed rollup table.
+
+        Args:
+            name: One of the keys of ``ROLLUPS``
+
+        Returns:
+            The rollup as last written by refresh_rollups.
+
+        Raises:
+            KeyError: If the name is not a known rollup.
+            FileNotFoundError: If refresh_rollups has not been run yet.
+        """
+        if name not in ROLLUPS:
+            raise KeyError(f"Unknown rollup {name!r}; expected one of {sorted(ROLLUPS)}")
+        return pl.read_parquet(self.rollups_dir / f"{name}.parquet")
+
+    def _partition_dir(self, day: date) -> Path:
+        return self.events_dir / f"date={day}"
+
+
+LOCK_TIMEOUT_SECONDS = 3600
+
+
+def _acquire_lock(lock: Path) -> bool:
+    """Atomically create a lock file; False if another process holds it."""
+    for _ in range(2):
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return True
+        except FileExistsError:
+            try:
+                if time.time() - lock.stat().st_mtime < LOCK_TIMEOUT_SECONDS:
+                    return False
+                lock.unlink()
+            except FileNotFoundError:
+                pass
+    return False
+
+
+def notebook_completion(events: pl.LazyFrame) -> pl.LazyFrame:
+    """Completion rate and time to completion per cohort and notebook.
+
+    Completion rate is the share of learners who opened the notebook and later
+    completed it; completions without a recorded open are not counted. Time to
+    completion is measured from a learner's first open to their first
+    completion of the notebook.
+    """
+    per_learner = events.group_by("cohort", "notebook", "learner_id").agg(
+        first_open=pl.col("timestamp").filter(pl.col("event_type") == EventType.OPEN).min(),
+        first_complete=pl.col("timestamp").filter(pl.col("event_type") == EventType.COMPLETE).min(),
+    )
+    # Only learners with an open event count, so the rate stays within [0, 1]
+    return (
+        per_learner.group_by("cohort", "notebook")
+        .agg(
+            learners_started=pl.col("first_open").is_not_null().sum(),
+            learners_completed=(
+                pl.col("first_open").is_not_null() & pl.col("first_complete").is_not_null()
+            ).sum(),
+            median_minutes_to_complete=(
+                (pl.col("first_complete") - pl.col("first_open")).dt.total_seconds() / 60
+            ).median(),
+        )
+        .with_columns(
+            completion_rate=pl.col("learners_completed") / pl.col("learners_started"),
+        )
+        .sort("cohort", "notebook", nulls_last=True)
+    )
+
+
+def learner_progress(events: pl.LazyFrame) -> pl.LazyFrame:
+    """Notebooks started and completed per learner, with first and last activity."""
+    return (
+        events.group_by("cohort", "learner_id")
+        .agg(
+            notebooks_started=pl.col("notebook")
+            .filter(pl.col("event_type") == EventType.OPEN)
+            .n_unique(),
+            notebooks_completed=pl.col("notebook")
+            .filter(pl.col("event_type") == EventType.COMPLETE)
+            .n_unique(),
+            first_activity=pl.col("timestamp").min(),
+            last_activity=pl.col("timestamp").max(),
+        )
+        .sort("cohort", "learner_id", nulls_last=True)
+    )
+
+
+def exercise_attempts(events: pl.LazyFrame) -> pl.LazyFrame:
+    """Attempts, successes and success rate per cohort, notebook and exercise."""
+    return (
+        events.filter(pl.col("event_type") == EventType.EXERCISE_ATTEMPT)
+        .group_by("cohort", "notebook", "exercise")
+        .agg(
+            attempts=pl.len(),
+            learners=pl.col("learner_id").n_unique(),
+            successes=pl.col("success").fill_null(False).sum(),
+        )
+        .with_columns(success_rate=pl.col("successes") / pl.col("attempts"))
+        .sort("cohort", "notebook", "exercise", nulls_last=True)
+    )
+
+
+ROLLUPS = {
+    "notebook_completion": notebook_completion,
+    "learner_progress": learner_progress,
+    "exercise_attempts": exercise_attempts,
+}
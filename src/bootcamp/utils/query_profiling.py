@@ -0,0 +1,368 @@
+"""Query-plan capture and slow-query logging for Polars and DuckDB.
+
+Wraps ``LazyFrame.collect`` and DuckDB ``execute`` so every query records its
+optimized plan, rows and bytes scanned, elapsed time and peak memory. Queries
+slower than a threshold are appended to a Parquet slow-query log that can be
+read back with Polars or DuckDB.
+
+Example:
+    profiler = QueryProfiler(slow_query_log="logs/slow_queries", threshold_seconds=0.5)
+    df, profile = profiler.collect(pl.scan_parquet("trips.parquet").filter(...))
+    df, profile = profiler.execute(conn, "SELECT * FROM trips WHERE fare > ?", [10])
+"""
+
+import json
+import re
+import sys
+import tempfile
+import time
+import uuid
+import warnings
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import polars as pl
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no resource module
+    resource = None
+
+
+class QueryPlanWarning(UserWarning):
+    """Warning emitted when a query plan contains a known anti-pattern."""
+
+
+@dataclass
+class QueryProfile:
+    """Measurements captured for a single profiled query.
+
+    Attributes:
+        engine: Query engine that ran the query ("polars" or "duckdb")
+        label: Human-readable query name (SQL text for DuckDB by default)
+        plan: Optimized query plan as rendered by the engine
+        elapsed_seconds: Wall-clock execution time in seconds
+        rows_returned: Number of rows in the result
+        rows_scanned: Rows read from sources, or None if the engine doesn't report it
+        bytes_scanned: Bytes read from sources, or None if unknown
+        peak_memory_bytes: Peak memory during execution (growth of the process peak RSS
+            for Polars, peak buffer memory for DuckDB), or None if unknown
+        warnings: Anti-pattern messages detected in the plan
+        started_at: UTC timestamp when the query started
+    """
+
+    engine: str
+    label: str
+    plan: str
+    elapsed_seconds: float
+    rows_returned: int
+    rows_scanned: int | None = None
+    bytes_scanned: int | None = None
+    peak_memory_bytes: int | None = None
+    warnings: list[str] = field(default_factory=list)
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+_LOG_SCHEMA = {
+    "engine": pl.String,
+    "label": pl.String,
+    "plan": pl.String,
+    "elapsed_seconds": pl.Float64,
+    "rows_returned": pl.Int64,
+    "rows_scanned": pl.Int64,
+    "bytes_scanned": pl.Int64,
+    "peak_memory_bytes": pl.Int64,
+    "warnings": pl.List(pl.String),
+    "started_at": pl.Datetime("us", "UTC"),
+}
+
+
+class SlowQueryLog:
+    """Append-only Parquet log of slow queries.
+
+    Each appended profile is written as its own Parquet file inside ``path`` so
+    appends never rewrite existing data. Read the log back with :meth:`scan` or
+    from DuckDB with ``SELECT * FROM read_parquet('<path>/*.parquet')``.
+
+    Args:
+        path: Directory that holds the log's Parquet files
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+
+    def append(self, profile: QueryProfile) -> Path:
+        """Write a profile to the log.
+
+        Args:
+            profile: Query profile to record
+
+        Returns:
+            Path of the Parquet file that was written.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        stamp = profile.started_at.strftime("%Y%m%dT%H%M%S%f")
+        target = self.path / f"query-{stamp}-{uuid.uuid4().hex[:8]}.parquet"
+        pl.DataFrame([asdict(profile)], schema=_LOG_SCHEMA).write_parquet(target)
+        return target
+
+    def scan(self) -> pl.LazyFrame:
+        """Lazily read every logged query.
+
+        Returns:
+            LazyFrame over all log entries. Empty (with the log schema) if
+            nothing has been logged yet.
+        """
+        if not any(self.path.glob("*.parquet")):
+            return pl.LazyFrame(schema=_LOG_SCHEMA)
+        return pl.scan_parquet(self.path / "*.parquet")
+
+
+class QueryProfiler:
+    """Profile Polars and DuckDB queries and log the slow ones.
+
+    Args:
+        slow_query_log: Directory (or SlowQueryLog) for queries over the threshold.
+            If None, slow queries are not persisted.
+        threshold_seconds: Queries taking at least this long are logged (default: 1.0)
+        warn: Emit QueryPlanWarning for anti-patterns found in plans (default: True)
+
+    Attributes:
+        profiles: Every profile captured by this profiler, in execution order
+    """
+
+    def __init__(
+        self,
+        slow_query_log: str | Path | SlowQueryLog | None = None,
+        threshold_seconds: float = 1.0,
+        warn: bool = True,
+    ) -> None:
+        if isinstance(slow_query_log, str | Path):
+            slow_query_log = SlowQueryLog(slow_query_log)
+        self.slow_query_log = slow_query_log
+        self.threshold_seconds = threshold_seconds
+        self.warn = warn
+        self.profiles: list[QueryProfile] = []
+
+    def collect(
+        self, lf: pl.LazyFrame, label: str = "polars query"
+    ) -> tuple[pl.DataFrame, QueryProfile]:
+        """Collect a LazyFrame while recording its plan and cost.
+
+        Args:
+            lf: LazyFrame to execute
+            label: Name stored with the profile (default: "polars query")
+
+        Returns:
+            Tuple of (collected DataFrame, QueryProfile).
+        """
+        plan = lf.explain()
+        started_at = datetime.now(UTC)
+        rss_before = _peak_rss_bytes()
+        start = time.perf_counter()
+        df = lf.collect()
+        elapsed = time.perf_counter() - start
+        rss_after = _peak_rss_bytes()
+
+        profile = QueryProfile(
+            engine="polars",
+            label=label,
+            plan=plan,
+            elapsed_seconds=elapsed,
+            rows_returned=df.height,
+            bytes_scanned=_polars_scanned_bytes(plan),
+            peak_memory_bytes=(
+                rss_after - rss_before if rss_before is not None and rss_after is not None else None
+            ),
+            warnings=detect_polars_antipatterns(plan),
+            started_at=started_at,
+        )
+        self._record(profile)
+        return df, profile
+
+    def execute(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        query: str,
+        parameters: list[Any] | dict[str, Any] | None = None,
+        label: str | None = None,
+    ) -> tuple[pl.DataFrame, QueryProfile]:
+        """Execute a DuckDB query while recording its plan and cost.
+
+        The query runs once with DuckDB's JSON profiler enabled, which supplies
+        rows scanned, bytes read, latency and peak buffer memory. Profiling is
+        disabled on the connection again afterwards. Statements that can't be
+        explained (e.g., PRAGMA, or several statements in one string) still run,
+        with an empty plan.
+
+        Args:
+            conn: DuckDB connection to run the query on
+            query: SQL text to execute
+            parameters: Optional prepared-statement parameters
+            label: Name stored with the profile (default: the SQL text)
+
+        Returns:
+            Tuple of (result as a Polars DataFrame, QueryProfile).
+        """
+        plan = _duckdb_plan(conn, query, parameters)
+        started_at = datetime.now(UTC)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            profile_path = Path(tmp) / "profile.json"
+            conn.execute("PRAGMA enable_profiling = 'json'")
+            conn.execute(f"PRAGMA profiling_output = '{profile_path.as_posix()}'")
+            try:
+                start = time.perf_counter()
+                cursor = conn.execute(query, parameters)
+                rows = cursor.fetchall()
+                elapsed = time.perf_counter() - start
+                columns = [column[0] for column in cursor.description or []]
+            finally:
+                conn.execute("PRAGMA disable_profiling")
+            metrics = json.loads(profile_path.read_text()) if profile_path.exists() else {}
+
+        df = pl.DataFrame(rows, schema=columns, orient="row")
+        profile = QueryProfile(
+            engine="duckdb",
+            label=label or query,
+            plan=plan,
+            elapsed_seconds=metrics.get("latency", elapsed),
+            rows_returned=len(rows),
+            rows_scanned=metrics.get("cumulative_rows_scanned"),
+            bytes_scanned=metrics.get("total_bytes_read"),
+            peak_memory_bytes=metrics.get("system_peak_buffer_memory"),
+            warnings=detect_duckdb_antipatterns(metrics),
+            started_at=started_at,
+        )
+        self._record(profile)
+        return df, profile
+
+    def _record(self, profile: QueryProfile) -> None:
+        self.profiles.append(profile)
+        if self.warn:
+            for message in profile.warnings:
+                warnings.warn(f"{profile.label}: {message}", QueryPlanWarning, stacklevel=3)
+        if self.slow_query_log is not None and profile.elapsed_seconds >= self.threshold_seconds:
+            self.slow_query_log.append(profile)
+
+
+def detect_polars_antipatterns(plan: str) -> list[str]:
+    """Find anti-patterns in an optimized Polars plan.
+
+    Only a FILTER whose immediate input is a scan is reported. Filters over an
+    aggregation (HAVING-style) or a join can't be pushed into a reader, and an
+    in-memory table elsewhere in the plan (e.g., a join lookup) is not a problem.
+
+    Args:
+        plan: Output of ``LazyFrame.explain()``
+
+    Returns:
+        List of human-readable warnings (empty if the plan looks healthy).
+    """
+    found = []
+    for source in _polars_filter_inputs(plan):
+        if source.startswith("DF ["):
+            found.append(
+                "FILTER over in-memory data; if this frame came from read_* or collect(), "
+                "use pl.scan_* instead so the predicate reaches the reader."
+            )
+        elif re.search(r"\bSCAN \[", source):
+            found.append(
+                "predicate was not pushed down into the scan; a FILTER node remains over "
+                "the scan in the optimized plan. Filter on source columns before derived ones."
+            )
+    return found
+
+
+def detect_duckdb_antipatterns(metrics: dict[str, Any]) -> list[str]:
+    """Find anti-patterns in a DuckDB JSON profile.
+
+    Only a FILTER operator reading directly from a scan is reported; filters
+    over aggregates (HAVING) or joins can't be pushed into a reader.
+
+    Args:
+        metrics: Parsed JSON written by DuckDB's ``enable_profiling = 'json'``
+
+    Returns:
+        List of human-readable warnings (empty if the plan looks healthy).
+    """
+    found = []
+    for op in _walk_operators(metrics):
+        if op.get("operator_type") == "FILTER" and any(
+            child.get("operator_type", "").endswith("SCAN") for child in op.get("children", [])
+        ):
+            found.append(
+                "predicate was not pushed down into the scan; a FILTER operator runs over "
+                "scanned rows. Filter on plain columns so DuckDB can push it into the reader."
+            )
+    return found
+
+
+def _duckdb_plan(
+    conn: duckdb.DuckDBPyConnection,
+    query: str,
+    parameters: list[Any] | dict[str, Any] | None,
+) -> str:
+    """Render DuckDB's physical plan for a single statement, or "" if it can't be explained."""
+    # EXPLAIN only covers the first statement and would execute the rest
+    if len(conn.extract_statements(query)) != 1:
+        return ""
+    try:
+        rows = conn.execute(f"EXPLAIN {query}", parameters).fetchall()
+    except duckdb.Error:
+        return ""
+    return "\n".join(row[1] for row in rows if len(row) > 1)
+
+
+def _walk_operators(node: dict[str, Any]):
+    for child in node.get("children", []):
+        yield child
+        yield from _walk_operators(child)
+
+
+def _polars_filter_inputs(plan: str) -> list[str]:
+    """Return the first line of the node feeding each FILTER in a Polars plan.
+
+    Plain column selections (``simple π``) between the filter and its input are
+    skipped, since they don't change which rows the filter sees.
+    """
+    lines = [line for line in plan.splitlines() if line.strip()]
+    inputs = []
+    for i, line in enumerate(lines):
+        if not line.lstrip().startswith("FILTER "):
+            continue
+        depth = len(line) - len(line.lstrip())
+        for child in lines[i + 1 :]:
+            node = child.strip()
+            if node == "FROM" or node.startswith("simple π"):
+                continue
+            if len(child) - len(child.lstrip()) > depth:
+                inputs.append(node)
+            break
+    return inputs
+
+
+def _polars_scanned_bytes(plan: str) -> int | None:
+    """Sum the on-disk size of files named in a Polars plan's SCAN nodes.
+
+    Polars abbreviates multi-file scans (``[a.parquet, ... 4 other sources]``),
+    so None is returned rather than an undercount when any scan is abbreviated.
+    """
+    scans = re.findall(r"SCAN \[(.*?)\]", plan)
+    if any("other sources" in sources for sources in scans):
+        return None
+    paths = [Path(path.strip()) for sources in scans for path in sources.split(",")]
+    sizes = [path.stat().st_size for path in paths if path.is_file()]
+    return sum(sizes) if sizes else None
+
+
+def _peak_rss_bytes() -> int | None:
+    """Return the process's peak resident set size in bytes, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,132 @@
+"""Tests for the ``bootcamp`` command-line check runner."""
+
+from pathlib import Path
+
+import pytest
+
+from bootcamp import cli
+from bootcamp.cli import EXECUTE, CheckResult, ResultCache, checks_for, discover_files, run_checks
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create a minimal repository layout and run from its root."""
+    (tmp_path / "notebooks" / "module_00").mkdir(parents=True)
+    (tmp_path / "notebooks" / "module_00" / "lesson.py").write_text("x = 1\n")
+    (tmp_path / "notebooks" / "module_00" / "remote.py").write_text(
+        '"""Remote notebook.\n\nTags: requires-databricks\n"""\n'
+    )
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_pkg.py").write_text("def test_ok():\n    pass\n")
+    (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    """Replace subprocess execution with a recorder that always passes."""
+    recorded: list[tuple[str, str]] = []
+
+    def fake_run_check(check: cli.Check, path: Path, timeout_seconds: int = 600) -> CheckResult:
+        recorded.append((check.name, path.as_posix()))
+        return CheckResult(check.name, path.as_posix(), 0, "", 0.01, False)
+
+    monkeypatch.setattr(cli, "run_check", fake_run_check)
+    return recorded
+
+
+def test_checks_for_selects_by_location(repo: Path) -> None:
+    """Verify notebooks are executed, tests run under pytest and tagged notebooks skipped.
+
+    Notebooks tagged requires-databricks import packages that aren't installed,
+    so they are neither executed nor type-checked.
+    """
+    names = {
+        p: [c.name for c in checks_for(Path(p))]
+        for p in (
+            "notebooks/module_00/lesson.py",
+            "notebooks/module_00/remote.py",
+            "src/pkg/__init__.py",
+            "tests/test_pkg.py",
+        )
+    }
+
+    assert names["notebooks/module_00/lesson.py"] == ["lint", "format", "typecheck", "execute"]
+    assert names["notebooks/module_00/remote.py"] == ["lint", "format"]
+    assert names["src/pkg/__init__.py"] == ["lint", "format", "typecheck"]
+    assert names["tests/test_pkg.py"] == ["lint", "format", "typecheck", "pytest"]
+
+
+def test_discover_files_expands_directories(repo: Path) -> None:
+    """Verify directories expand to sorted Python files."""
+    files = discover_files([Path("notebooks"), Path("tests/test_pkg.py")])
+
+    assert [f.as_posix() for f in files] == [
+        "notebooks/module_00/lesson.py",
+        "notebooks/module_00/remote.py",
+        "tests/test_pkg.py",
+    ]
+
+
+def test_unchanged_files_are_served_from_cache(repo: Path, calls: list) -> None:
+    """Verify a second run only re-checks the file whose content changed."""
+    files = discover_files([Path("notebooks")])
+    cache = ResultCache()
+    run_checks(files, cache=cache)
+    cache.save()
+    first_run = len(calls)
+
+    Path("notebooks/module_00/lesson.py").write_text("x = 2\n")
+    calls.clear()
+    results = run_checks(files, cache=ResultCache())
+
+    assert first_run == 6
+    assert {path for _, path in calls} == {"notebooks/module_00/lesson.py"}
+    assert sum(r.cached for r in results) == 2
+
+
+def test_src_change_invalidates_import_dependent_results(repo: Path, calls: list) -> None:
+    """Verify typecheck and pytest re-run when package source changes; lint and format don't."""
+    files = [Path("tests/test_pkg.py")]
+    cache = ResultCache()
+    run_checks(files, cache=cache)
+    cache.save()
+
+    Path("src/pkg/__init__.py").write_text("VALUE = 1\n")
+    calls.clear()
+    run_checks(files, cache=ResultCache())
+
+    assert sorted(calls) == [("pytest", "tests/test_pkg.py"), ("typecheck", "tests/test_pkg.py")]
+
+
+def test_absolute_paths_keep_location_checks(repo: Path) -> None:
+    """Verify absolute paths are resolved against the repository root."""
+    files = discover_files([repo / "notebooks" / "module_00" / "lesson.py"])
+
+    assert files == [Path("notebooks/module_00/lesson.py")]
+    assert EXECUTE in checks_for(repo / "notebooks" / "module_00" / "lesson.py")
+
+
+def test_skipped_checks_are_not_run(repo: Path, calls: list) -> None:
+    """Verify --skip leaves the named check out entirely."""
+    results = run_checks([Path("notebooks/module_00/lesson.py")], skip=["execute"])
+
+    assert "execute" not in {name for name, _ in calls}
+    assert [r.check for r in results] == ["format", "lint", "typecheck"]
+
+
+def test_report_lists_failures_and_summary() -> None:
+    """Verify the merged report shows failing output and totals."""
+    results = [
+        CheckResult("lint", "a.py", 1, "F401 unused import", 0.1, False),
+        CheckResult("format", "a.py", 0, "", 0.0, True),
+    ]
+
+    report = cli.format_report(results)
+
+    assert "FAILED lint a.py (exit 1)" in report
+    assert "    F401 unused import" in report
+    assert report.endswith("1 passed, 1 failed (2 checks on 1 files, 1 from cache)")
@@ -0,0 +1,150 @@
+"""Tests for the learner event log, compaction and rollups."""
+
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from bootcamp.utils.events import EventLog, EventType, LearnerEvent
+
+START = datetime(2026, 9, 1, 9, 0, tzinfo=UTC)
+
+
+def _event(
+    learner: str, notebook: str, kind: EventType, minutes: int = 0, **kwargs
+) -> LearnerEvent:
+    return LearnerEvent(
+        learner,
+        notebook,
+        kind,
+        cohort="fall",
+        timestamp=START + timedelta(minutes=minutes),
+        **kwargs,
+    )
+
+
+def test_events_are_buffered_until_batch_is_full(tmp_path: Path) -> None:
+    """Verify nothing is written until the batch size is reached."""
+    log = EventLog(tmp_path, batch_size=3)
+
+    log.record(_event("a", "00_01", EventType.OPEN))
+    log.record(_event("b", "00_01", EventType.OPEN))
+    assert log.scan().collect().height == 0
+
+    log.record(_event("c", "00_01", EventType.OPEN))
+    assert log.scan().collect().height == 3
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+
+
+def test_close_flushes_into_day_partitions(tmp_path: Path) -> None:
+    """Verify the context manager flushes and events land in per-day partitions."""
+    with EventLog(tmp_path) as log:
+        log.record(_event("a", "00_01", EventType.OPEN))
+        log.record(_event("a", "00_01", EventType.COMPLETE, minutes=60 * 24))
+
+    partitions = sorted(p.name for p in (tmp_path / "events").iterdir())
+    assert partitions == ["date=2026-09-01", "date=2026-09-02"]
+    assert log.scan().collect()["event_type"].to_list() == ["open", "complete"]
+
+
+def test_failed_flush_keeps_events_buffered(tmp_path: Path) -> None:
+    """Verify events survive a failed write and are flushed on the next attempt."""
+    blocker = tmp_path / "blocked"
+    blocker.write_text("not a directory")
+    log = EventLog(blocker)
+    log.record(_event("a", "00_01", EventType.OPEN))
+
+    with pytest.raises(OSError):
+        log.flush()
+
+    log.root = tmp_path / "telemetry"
+    log.flush()
+    assert log.scan().collect()["learner_id"].to_list() == ["a"]
+
+
+def test_compact_merges_small_files(tmp_path: Path) -> None:
+    """Verify compaction leaves one file per partition and keeps every event."""
+    log = EventLog(tmp_path, batch_size=1)
+    for i in range(4):
+        log.record(_event(f"learner-{i}", "00_01", EventType.OPEN, minutes=i))
+
+    removed = log.compact()
+
+    assert removed == 4
+    assert len(list(tmp_path.rglob("*.parquet"))) == 1
+    assert log.scan().collect().height == 4
+
+
+def test_compact_skips_partition_locked_by_another_compactor(tmp_path: Path) -> None:
+    """Verify a partition claimed by a concurrent compactor is left untouched."""
+    log = EventLog(tmp_path, batch_size=1)
+    for i in range(3):
+        log.record(_event(f"learner-{i}", "00_01", EventType.OPEN, minutes=i))
+    (tmp_path / "events" / "date=2026-09-01" / ".compact.lock").touch()
+
+    assert log.compact() == 0
+    assert len(list(tmp_path.rglob("*.parquet"))) == 3
+    assert log.scan().collect().height == 3
+
+
+def test_compact_leaves_large_files_alone(tmp_path: Path) -> None:
+    """Verify already-compacted files above the size threshold aren't rewritten."""
+    log = EventLog(tmp_path, batch_size=1)
+    for i in range(3):
+        log.record(_event(f"learner-{i}", "00_01", EventType.OPEN, minutes=i))
+    log.compact()
+    (compacted,) = tmp_path.rglob("*.parquet")
+    for i in range(2):
+        log.record(_event(f"late-{i}", "00_01", EventType.OPEN, minutes=10 + i))
+
+    removed = log.compact(small_file_bytes=compacted.stat().st_size)
+
+    assert removed == 2
+    assert compacted.exists()
+    assert log.scan().collect().height == 5
+
+
+def test_rollups(tmp_path: Path) -> None:
+    """Verify completion, progress and exercise rollups are precomputed."""
+    with EventLog(tmp_path) as log:
+        log.record(_event("a", "00_01", EventType.OPEN))
+        log.record(_event("a", "00_01", EventType.COMPLETE, minutes=30))
+        log.record(_event("b", "00_01", EventType.OPEN))
+        log.record(_event("b", "00_01", EventType.EXERCISE_ATTEMPT, exercise="ex1", success=False))
+        log.record(_event("b", "00_01", EventType.EXERCISE_ATTEMPT, exercise="ex1", success=True))
+
+    log.refresh_rollups()
+
+    completion = log.rollup("notebook_completion").row(0, named=True)
+    assert completion["learners_started"] == 2
+    assert completion["learners_completed"] == 1
+    assert completion["completion_rate"] == 0.5
+    assert completion["median_minutes_to_complete"] == 30.0
+
+    progress = log.rollup("learner_progress")
+    assert progress["notebooks_completed"].to_list() == [1, 0]
+
+    exercises = log.rollup("exercise_attempts").row(0, named=True)
+    assert (exercises["attempts"], exercises["successes"]) == (2, 1)
+
+
+def test_completion_without_open_is_not_counted(tmp_path: Path) -> None:
+    """Verify a completion with no open event can't push the rate past the openers."""
+    with EventLog(tmp_path) as log:
+        log.record(_event("a", "00_01", EventType.COMPLETE, minutes=10))
+        log.record(_event("b", "00_01", EventType.OPEN))
+        log.record(_event("c", "00_01", EventType.OPEN))
+        log.record(_event("c", "00_01", EventType.COMPLETE, minutes=5))
+
+    log.refresh_rollups()
+
+    completion = log.rollup("notebook_completion").row(0, named=True)
+    assert completion["learners_started"] == 2
+    assert completion["learners_completed"] == 1
+    assert completion["completion_rate"] == 0.5
+
+
+def test_unknown_rollup(tmp_path: Path) -> None:
+    """Verify requesting an unknown rollup raises KeyError."""
+    with pytest.raises(KeyError):
+        EventLog(tmp_path).rollup("weekly_active_users")
@@ -0,0 +1,160 @@
+"""Tests for query-plan capture and the slow-query log."""
+
+from pathlib import Path
+
+import duckdb
+import polars as pl
+import pytest
+
+from bootcamp.utils.query_profiling import (
+    QueryPlanWarning,
+    QueryProfiler,
+    SlowQueryLog,
+    detect_duckdb_antipatterns,
+    detect_polars_antipatterns,
+)
+
+
+@pytest.fixture
+def trips(tmp_path: Path) -> Path:
+    """Write a small Parquet file to query."""
+    path = tmp_path / "trips.parquet"
+    pl.DataFrame({"fare": [5.0, 12.5, 30.0], "city": ["a", "b", "a"]}).write_parquet(path)
+    return path
+
+
+def test_collect_records_plan_and_pushdown(trips: Path) -> None:
+    """Verify a pushed-down Polars query is profiled without warnings."""
+    profiler = QueryProfiler()
+    lf = pl.scan_parquet(trips).filter(pl.col("fare") > 10).select("city")
+
+    df, profile = profiler.collect(lf, label="expensive trips")
+
+    assert df.height == 2
+    assert profile.engine == "polars"
+    assert profile.rows_returned == 2
+    assert "SELECTION" in profile.plan
+    assert profile.bytes_scanned == trips.stat().st_size
+    assert profile.warnings == []
+    assert profiler.profiles == [profile]
+
+
+def test_collect_warns_on_eager_collect_before_filter(trips: Path) -> None:
+    """Verify filtering an already-collected DataFrame is flagged."""
+    lf = pl.read_parquet(trips).lazy().filter(pl.col("fare") > 10)
+
+    with pytest.warns(QueryPlanWarning, match="FILTER over in-memory data"):
+        _, profile = QueryProfiler().collect(lf)
+
+    assert len(profile.warnings) == 1
+
+
+def test_detect_polars_missing_pushdown(trips: Path) -> None:
+    """Verify a filter left directly over the scan is reported as not pushed down."""
+    lf = pl.scan_parquet(trips).filter(pl.col("fare") > pl.col("fare").mean())
+
+    warnings = detect_polars_antipatterns(lf.explain())
+
+    assert len(warnings) == 1
+    assert "not pushed down" in warnings[0]
+
+
+def test_detect_polars_ignores_having_and_join_lookup(trips: Path) -> None:
+    """Verify filters after an aggregate or over a join with an in-memory table pass."""
+    lookup = pl.DataFrame({"city": ["a", "b"], "region": ["north", "south"]}).lazy()
+    having = (
+        pl.scan_parquet(trips)
+        .group_by("city")
+        .agg(pl.col("fare").sum())
+        .filter(pl.col("fare") > 10)
+    )
+    joined = (
+        pl.scan_parquet(trips)
+        .join(lookup, on="city")
+        .group_by("region")
+        .agg(pl.col("fare").sum())
+        .filter(pl.col("fare") > 10)
+    )
+
+    assert detect_polars_antipatterns(having.explain()) == []
+    assert detect_polars_antipatterns(joined.explain()) == []
+
+
+def test_polars_multi_file_scan_bytes_unknown(tmp_path: Path) -> None:
+    """Verify abbreviated multi-file scans don't report the first file's size."""
+    for i in range(5):
+        pl.DataFrame({"fare": [float(i)]}).write_parquet(tmp_path / f"part-{i}.parquet")
+
+    _, profile = QueryProfiler().collect(pl.scan_parquet(tmp_path / "*.parquet"))
+
+    assert profile.bytes_scanned is None
+
+
+def test_execute_records_duckdb_metrics(trips: Path) -> None:
+    """Verify DuckDB queries report scanned rows from the profiler."""
+    conn = duckdb.connect()
+    profiler = QueryProfiler()
+
+    df, profile = profiler.execute(
+        conn, f"SELECT city FROM read_parquet('{trips}') WHERE fare > ?", [10]
+    )
+
+    assert df.columns == ["city"]
+    assert df.height == 2
+    assert profile.engine == "duckdb"
+    assert profile.rows_scanned == 3
+    assert "Filters: fare>10" in profile.plan
+    assert profile.warnings == []
+
+
+def test_execute_runs_statements_that_cannot_be_explained() -> None:
+    """Verify PRAGMA and multi-statement queries run with an empty plan."""
+    conn = duckdb.connect()
+    profiler = QueryProfiler()
+
+    version, pragma = profiler.execute(conn, "PRAGMA version")
+    last, multi = profiler.execute(conn, "SELECT 1 AS a; SELECT 2 AS a")
+
+    assert version.height == 1
+    assert pragma.plan == ""
+    assert last["a"].to_list() == [2]
+    assert multi.plan == ""
+
+
+def test_duckdb_pushdown_warnings(trips: Path) -> None:
+    """Verify DuckDB only warns when a FILTER reads directly from a scan."""
+    conn = duckdb.connect()
+    profiler = QueryProfiler(warn=False)
+
+    _, unpushed = profiler.execute(conn, "SELECT * FROM range(10) WHERE range % 2 = 0")
+    _, having = profiler.execute(
+        conn,
+        f"SELECT city, sum(fare) FROM read_parquet('{trips}') GROUP BY city HAVING sum(fare) > 10",
+    )
+
+    assert len(unpushed.warnings) == 1
+    assert having.warnings == []
+    assert detect_duckdb_antipatterns({"children": []}) == []
+
+
+def test_slow_queries_are_logged(tmp_path: Path, trips: Path) -> None:
+    """Verify queries over the threshold land in the Parquet log."""
+    log = SlowQueryLog(tmp_path / "slow")
+    profiler = QueryProfiler(slow_query_log=log, threshold_seconds=0.0)
+
+    profiler.collect(pl.scan_parquet(trips), label="full scan")
+    profiler.execute(duckdb.connect(), "SELECT 42 AS answer")
+
+    logged = log.scan().sort("started_at").collect()
+    assert logged["engine"].to_list() == ["polars", "duckdb"]
+    assert logged["label"].to_list() == ["full scan", "SELECT 42 AS answer"]
+
+
+def test_fast_queries_are_not_logged(tmp_path: Path) -> None:
+    """Verify queries under the threshold are not persisted."""
+    log = SlowQueryLog(tmp_path / "slow")
+    profiler = QueryProfiler(slow_query_log=log, threshold_seconds=60.0)
+
+    profiler.execute(duckdb.connect(), "SELECT 1")
+
+    assert log.scan().collect().height == 0
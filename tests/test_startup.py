@@ -0,0 +1,129 @@
+"""Tests for lazy library facades and notebook startup tooling."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from bootcamp.lazy import lazy_import
+from bootcamp.startup import (
+    ImportTime,
+    NotebookImportReport,
+    _lazy_equivalent,
+    format_import_report,
+    notebook_imports,
+    parse_importtime,
+)
+
+
+def _run(code: str, directory: Path) -> str:
+    """Run code as a script in a fresh interpreter that can import bootcamp."""
+    script = directory / "script.py"
+    script.write_text(code)
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(Path("src").resolve())},
+    )
+    return result.stdout.strip()
+
+
+def test_facade_defers_import_until_attribute_access(tmp_path: Path) -> None:
+    """Verify ``from bootcamp import pl`` does not execute polars until used."""
+    output = _run(
+        "import sys\n"
+        "from bootcamp import pl\n"
+        "print('polars.dataframe' in sys.modules)\n"
+        "pl.DataFrame\n"
+        "print('polars.dataframe' in sys.modules)",
+        tmp_path,
+    )
+
+    assert output.splitlines() == ["False", "True"]
+
+
+def test_unknown_attribute_raises() -> None:
+    """Verify names outside the facade list still raise AttributeError."""
+    import bootcamp
+
+    with pytest.raises(AttributeError):
+        _ = bootcamp.not_a_library
+
+
+def test_lazy_import_missing_module() -> None:
+    """Verify a missing library fails at bind time, not on first use."""
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("bootcamp_library_that_does_not_exist")
+
+
+def test_parse_importtime_depths() -> None:
+    """Verify -X importtime lines are parsed with their nesting level."""
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       308 |        308 |       _json\n"
+        "import time:       702 |      13365 |   json.decoder\n"
+        "import time:       312 |      14294 | json\n"
+    )
+
+    assert parse_importtime(stderr) == [
+        ImportTime("_json", 308, 308, 3),
+        ImportTime("json.decoder", 702, 13365, 1),
+        ImportTime("json", 312, 14294, 0),
+    ]
+
+
+def test_notebook_imports_finds_imports_inside_cells(tmp_path: Path) -> None:
+    """Verify imports nested in marimo cell functions are collected once."""
+    notebook = tmp_path / "lesson.py"
+    notebook.write_text(
+        "import marimo\n"
+        "@app.cell\n"
+        "def __():\n"
+        "    import polars as pl\n"
+        "    from sklearn.linear_model import LinearRegression\n"
+        "    from . import local\n"
+        "    import marimo\n"
+    )
+
+    assert notebook_imports(notebook) == [
+        "import marimo",
+        "import polars as pl",
+        "from sklearn.linear_model import LinearRegression",
+    ]
+
+
+def test_lazy_run_touches_attributes_the_notebook_uses(tmp_path: Path) -> None:
+    """Verify the lazy measurement executes modules whose attributes are used."""
+    notebook = tmp_path / "lesson.py"
+    notebook.write_text(
+        "import colorsys\n"
+        "import fractions as fr\n"
+        "def __():\n"
+        "    return colorsys.rgb_to_hsv(1, 0, 0)\n"
+    )
+
+    output = _run(
+        _lazy_equivalent(notebook) + "\n"
+        "import sys\n"
+        "print(type(sys.modules['colorsys']).__name__)\n"
+        "print(type(sys.modules['fractions']).__name__)",
+        tmp_path,
+    )
+
+    # LazyLoader swaps the class back to ModuleType once the module executes
+    assert output.splitlines() == ["module", "_LazyModule"]
+
+
+def test_report_treats_differences_within_spread_as_noise() -> None:
+    """Verify a median difference smaller than the run-to-run spread isn't a saving."""
+    noisy = NotebookImportReport(Path("a.py"), [], [750.0, 865.0, 766.0], [743.0, 754.0, 920.0])
+    clear = NotebookImportReport(Path("b.py"), [], [900.0, 910.0, 905.0], [10.0, 12.0, 11.0])
+
+    lines = format_import_report([noisy, clear]).splitlines()
+
+    assert lines[0].endswith("within noise")
+    assert "eager 766.0 ms (750.0-865.0)" in lines[0]
+    assert lines[1].endswith("saves 894.0 ms")